@@ -1,6 +1,34 @@
 """huti - Python helpers and utilities."""
-from . import constants
-from .constants import *
+__all__ = (
+    "JOSE",
+)
 
-__all__ = \
-    constants.__all__
+_submodules = (
+    "constants",
+)
+
+_name_to_module = {
+    "JOSE": "template.constants",
+}
+
+
+def __getattr__(name):
+    """Import the owning submodule on first access (PEP 562)."""
+    if name in _submodules:
+        mod_name = f"{__name__}.{name}"
+    else:
+        mod_name = _name_to_module.get(name)
+    if mod_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    from importlib import import_module
+
+    module = import_module(mod_name)
+    value = module if name in _submodules else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily exported names and submodules."""
+    return sorted(set(globals()) | set(_submodules) | set(_name_to_module))
@@ -1,6 +1,36 @@
+import importlib
+
+import pytest
+
 import template
 
 
 def test_import() -> None:
     """Test that the package can be imported."""
     assert isinstance(template.__name__, str)
+
+
+def test_all_matches_constants() -> None:
+    """Test that the package exports match the constants module."""
+    assert template.__all__ == template.constants.__all__
+
+
+def test_all_resolves() -> None:
+    """Test that every exported name resolves to the object in its owning module."""
+    for name in template.__all__:
+        module = importlib.import_module(template._name_to_module[name])
+        assert getattr(template, name) == getattr(module, name)
+
+
+def test_unknown_attribute() -> None:
+    """Test that an unknown attribute raises AttributeError."""
+    with pytest.raises(AttributeError):
+        template.unknown_attribute  # noqa: B018
+
+
+def test_dir_no_duplicates() -> None:
+    """Test that dir() has no duplicates after an attribute has been accessed."""
+    assert template.JOSE
+    names = dir(template)
+    assert len(names) == len(set(names))
+    assert "constants" in names